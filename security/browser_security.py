@@ -4,128 +4,61 @@ Protects against ads, popups, malicious JavaScript, and other threats.
 """
 
 import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Callable
 
+from . import patterns
 
-class BrowserSecurity:
-    """Security configuration for browser automation."""
 
-    # Common ad/tracking domains to block
-    AD_DOMAINS = [
-        'doubleclick.net',
-        'googlesyndication.com',
-        'googleadservices.com',
-        'google-analytics.com',
-        'googletagmanager.com',
-        'facebook.net',
-        'fbcdn.net',
-        'analytics.',
-        'tracker.',
-        'tracking.',
-        'ad.',
-        'ads.',
-        'adserver.',
-        'advertising.',
-        'banner.',
-        'pixel.',
-        'beacon.',
-        'telemetry.',
-        'metrics.',
-        'taboola.com',
-        'outbrain.com',
-        'criteo.com',
-        'adnxs.com',
-        'pubmatic.com',
-        'rubiconproject.com',
-        'openx.net',
-        'bidswitch.net',
-        'casalemedia.com',
-        'quantserve.com',
-        'scorecardresearch.com',
-        'amazon-adsystem.com',
-    ]
-
-    # Malicious popup patterns
-    POPUP_PATTERNS = [
-        r'window\.open\s*\(',
-        r'window\.alert\s*\(',
-        r'window\.confirm\s*\(',
-        r'window\.prompt\s*\(',
-        r'document\.write\s*\(',
-        r'eval\s*\(',
-        r'setTimeout\s*\(\s*["\']',
-        r'setInterval\s*\(\s*["\']',
-    ]
-
-    # Suspicious URL patterns
-    SUSPICIOUS_URLS = [
-        r'\.exe$',
-        r'\.scr$',
-        r'\.bat$',
-        r'\.cmd$',
-        r'\.msi$',
-        r'download.*\?.*redirect',
-        r'click.*track',
-        r'redirect\.',
-        r'bit\.ly',
-        r'tinyurl\.com',
-        r'goo\.gl',
-    ]
-
-    # Elements that are often malicious/annoying
-    BLOCK_SELECTORS = [
-        '[class*="popup"]',
-        '[class*="modal"]',
-        '[class*="overlay"]',
-        '[id*="popup"]',
-        '[id*="modal"]',
-        '[id*="overlay"]',
-        '[class*="newsletter"]',
-        '[class*="subscribe"]',
-        '[class*="cookie-banner"]',
-        '[class*="gdpr"]',
-        '[class*="consent"]',
-        'iframe[src*="ad"]',
-        'iframe[src*="banner"]',
-        'div[class*="ad-"]',
-        'div[id*="ad-"]',
-    ]
-
-    def __init__(self):
-        self._compiled_popup_patterns = [re.compile(p, re.IGNORECASE) for p in self.POPUP_PATTERNS]
-        self._compiled_url_patterns = [re.compile(p, re.IGNORECASE) for p in self.SUSPICIOUS_URLS]
+# [scheme:]//[userinfo@]host - anchored, so only the authority is ever read,
+# never a long path or query string. Userinfo runs to the last '@', as in
+# urlsplit and browsers.
+_HOST_RE = re.compile(r'(?:[a-z][a-z0-9+.-]*:)?//(?:[^/?#]*@)?(\[[^\]/?#]*\]|[^/?#:]*)', re.IGNORECASE)
 
-    def get_blocked_domains(self) -> List[str]:
-        """Get list of domains to block."""
-        return self.AD_DOMAINS.copy()
 
-    def should_block_url(self, url: str) -> bool:
-        """Check if URL should be blocked."""
-        url_lower = url.lower()
+def _hostname(url: str) -> str:
+    """Lowercased hostname of a URL, or '' if it has no authority (data:, blob:, ...)."""
+    match = _HOST_RE.match(url.strip())
+    if not match:
+        return ''
+    host = match.group(1).lower()
+    # A fully qualified name ('doubleclick.net.') is the same host
+    return host[:-1] if host.endswith('.') else host
 
-        # Check against ad domains
-        for domain in self.AD_DOMAINS:
-            if domain in url_lower:
-                return True
 
-        # Check suspicious patterns
-        for pattern in self._compiled_url_patterns:
-            if pattern.search(url):
-                return True
+# Derived matchers below are cached on the list contents, so edits to
+# AD_DOMAINS/SUSPICIOUS_URLS and subclass overrides take effect.
+@lru_cache(maxsize=None)
+def _ad_host_matcher(ad_domains: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Build a hostname -> blocked check for an AD_DOMAINS list.
 
-        return False
+    Registrable domains ('doubleclick.net') match the host or any subdomain;
+    entries ending in '.' ('ads.', 'pixel.') match a host label. Results are
+    cached by hostname: tracker URLs repeat hosts but rarely full URLs.
+    """
+    domains = frozenset(d for d in ad_domains if not d.endswith('.'))
+    suffixes = tuple('.' + d for d in domains)
+    labels = frozenset(d[:-1] for d in ad_domains if d.endswith('.'))
 
-    def get_content_security_headers(self) -> Dict[str, str]:
-        """Get secure headers to inject."""
-        return {
-            'X-Frame-Options': 'DENY',
-            'X-Content-Type-Options': 'nosniff',
-            'X-XSS-Protection': '1; mode=block',
-        }
+    @lru_cache(maxsize=4096)
+    def is_ad_host(host: str) -> bool:
+        if host in domains or host.endswith(suffixes):
+            return True
+        # Any label except the TLD, e.g. 'ads' in ads.example.com
+        return not labels.isdisjoint(host.split('.')[:-1])
 
-    def get_ad_block_script(self) -> str:
-        """JavaScript to inject for blocking ads and popups."""
-        return '''
+    return is_ad_host
+
+
+@lru_cache(maxsize=None)
+def _union_regex(expressions: Tuple[str, ...]) -> re.Pattern:
+    """Compile a pattern list into one case-insensitive alternation."""
+    return re.compile('|'.join(f'(?:{p})' for p in expressions), re.IGNORECASE)
+
+
+# Injected into every page; built once at import rather than per call
+_AD_BLOCK_SCRIPT = '''
         (function() {
             // Block popups
             window.open = function() { console.log('Popup blocked'); return null; };
@@ -175,18 +108,60 @@ class BrowserSecurity:
         })();
         '''
 
+
+class BrowserSecurity:
+    """Security configuration for browser automation."""
+
+    # Class-level views of the shared registry (see patterns.py)
+    AD_DOMAINS = list(patterns.AD_DOMAINS)
+    POPUP_PATTERNS = list(patterns.POPUP_PATTERNS)
+    SUSPICIOUS_URLS = list(patterns.SUSPICIOUS_URLS)
+    BLOCK_SELECTORS = list(patterns.BLOCK_SELECTORS)
+
+    def _is_ad_host(self, host: str) -> bool:
+        """Check a lowercased hostname against AD_DOMAINS."""
+        return _ad_host_matcher(tuple(self.AD_DOMAINS))(host)
+
+    def get_blocked_domains(self) -> List[str]:
+        """Get list of domains to block."""
+        return self.AD_DOMAINS.copy()
+
+    def should_block_url(self, url: str) -> bool:
+        """Check if URL should be blocked."""
+        # Check against ad domains; URLs without a host (data:, blob:) skip this
+        host = _hostname(url)
+        if host and self._is_ad_host(host):
+            return True
+
+        # Check suspicious patterns
+        if _union_regex(tuple(self.SUSPICIOUS_URLS)).search(url):
+            return True
+
+        return False
+
+    def get_content_security_headers(self) -> Dict[str, str]:
+        """Get secure headers to inject."""
+        return {
+            'X-Frame-Options': 'DENY',
+            'X-Content-Type-Options': 'nosniff',
+            'X-XSS-Protection': '1; mode=block',
+        }
+
+    def get_ad_block_script(self) -> str:
+        """JavaScript to inject for blocking ads and popups."""
+        return _AD_BLOCK_SCRIPT
+
     def get_playwright_route_handler(self):
         """Get a route handler function for Playwright to block ads."""
-        blocked_domains = self.get_blocked_domains()
+        # Resolved once per handler (one per browser context), not per request
+        is_ad_host = _ad_host_matcher(tuple(self.AD_DOMAINS))
 
         async def route_handler(route):
-            url = route.request.url.lower()
-
-            # Check if should block
-            for domain in blocked_domains:
-                if domain in url:
-                    await route.abort()
-                    return
+            # Check if should block; URLs without a host (data:, blob:) pass
+            host = _hostname(route.request.url)
+            if host and is_ad_host(host):
+                await route.abort()
+                return
 
             # Allow everything else
             await route.continue_()
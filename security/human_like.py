@@ -6,7 +6,22 @@ Makes browser automation appear more human to avoid bot detection.
 import random
 import time
 import asyncio
-from typing import Tuple, Optional
+from array import array
+from typing import List, Tuple, Optional
+
+# Characters that take longer to type (shift/reach keys)
+_SPECIAL_CHARS = frozenset('!@#$%^&*()_+-=[]{}|;:\'",.<>?/\\`~')
+
+# Per-key typing delay before speed scaling: uniform base range, slowed for
+# special characters. Anything above the slowest normal key is a thinking pause.
+_KEY_DELAY_MIN = 0.05
+_KEY_DELAY_MAX = 0.15
+_SPECIAL_KEY_FACTOR = 1.5
+_MAX_KEY_DELAY = _KEY_DELAY_MAX * _SPECIAL_KEY_FACTOR
+
+# Keys batched into one typed run may differ from the run's mean delay by at
+# most this fraction, so batching never flattens typing to a constant cadence
+_RUN_DELAY_TOLERANCE = 0.25
 
 
 class HumanBehavior:
@@ -22,6 +37,9 @@ class HumanBehavior:
             'normal': 1.0,
             'slow': 1.5
         }.get(speed, 1.0)
+        # Per-instance generator for click/form-fill randoms; avoids the
+        # module-level randint wrapper on every draw
+        self._rng = random.Random()
 
     def random_delay(self, min_sec: float = 0.5, max_sec: float = 2.0) -> float:
         """Get a random delay time."""
@@ -38,16 +56,18 @@ class HumanBehavior:
 
     def typing_delay(self, char: str) -> float:
         """Get realistic typing delay for a character."""
-        # Base delay
-        base = random.uniform(0.05, 0.15)
+        rand = random.random
+
+        # Base delay, uniform in [0.05, 0.15)
+        base = _KEY_DELAY_MIN + (_KEY_DELAY_MAX - _KEY_DELAY_MIN) * rand()
 
         # Slower for special characters
-        if char in '!@#$%^&*()_+-=[]{}|;:\'",.<>?/\\`~':
-            base *= 1.5
+        if char in _SPECIAL_CHARS:
+            base *= _SPECIAL_KEY_FACTOR
 
-        # Occasional pause (thinking)
-        if random.random() < 0.05:
-            base += random.uniform(0.2, 0.5)
+        # Occasional pause (thinking), uniform in [0.2, 0.5)
+        if rand() < 0.05:
+            base += 0.2 + 0.3 * rand()
 
         return base * self.speed_multiplier
 
@@ -57,25 +77,24 @@ class HumanBehavior:
         Includes occasional typos and corrections.
         """
         sequence = []
-        i = 0
-        while i < len(text):
-            char = text[i]
+        # Bind hot lookups once; this loop runs per character
+        append = sequence.append
+        rand = random.random
+        typing_delay = self.typing_delay
 
+        for char in text:
             # Occasional typo (5% chance)
-            if random.random() < 0.05 and char.isalpha():
+            if rand() < 0.05 and char.isalpha():
                 # Type wrong character
                 wrong_char = self._nearby_key(char)
-                sequence.append((wrong_char, self.typing_delay(wrong_char)))
+                append((wrong_char, typing_delay(wrong_char)))
                 # Pause to "notice"
-                sequence.append(('PAUSE', random.uniform(0.2, 0.4)))
+                append(('PAUSE', 0.2 + 0.2 * rand()))
                 # Backspace
-                sequence.append(('BACKSPACE', 0.1))
-                # Type correct character
-                sequence.append((char, self.typing_delay(char)))
-            else:
-                sequence.append((char, self.typing_delay(char)))
+                append(('BACKSPACE', 0.1))
 
-            i += 1
+            # Type correct character
+            append((char, typing_delay(char)))
 
         return sequence
 
@@ -104,34 +123,49 @@ class HumanBehavior:
         Generate a human-like mouse movement path.
         Uses bezier curve for natural movement.
         """
+        xs, ys = self.mouse_path_xy(start, end, steps)
+        return list(zip(xs, ys))
+
+    def mouse_path_xy(
+        self,
+        start: Tuple[int, int],
+        end: Tuple[int, int],
+        steps: int = None
+    ) -> Tuple[array, array]:
+        """
+        Same path as mouse_path, as separate x and y int arrays.
+        Avoids building a tuple per point for long paths.
+        """
         if steps is None:
             distance = ((end[0] - start[0])**2 + (end[1] - start[1])**2)**0.5
             steps = max(10, int(distance / 10))
 
-        # Control points for bezier curve
-        cp1 = (
-            start[0] + random.randint(-50, 50),
-            start[1] + random.randint(-50, 50)
-        )
-        cp2 = (
-            end[0] + random.randint(-50, 50),
-            end[1] + random.randint(-50, 50)
-        )
+        sx, sy = start
+        ex, ey = end
 
-        path = []
+        # Control points for bezier curve
+        c1x = sx + random.randint(-50, 50)
+        c1y = sy + random.randint(-50, 50)
+        c2x = ex + random.randint(-50, 50)
+        c2y = ey + random.randint(-50, 50)
+
+        rand = random.random
+        xs = array('i', [0]) * (steps + 1)
+        ys = array('i', [0]) * (steps + 1)
         for i in range(steps + 1):
             t = i / steps
-            # Cubic bezier formula
-            x = (1-t)**3 * start[0] + 3*(1-t)**2*t * cp1[0] + 3*(1-t)*t**2 * cp2[0] + t**3 * end[0]
-            y = (1-t)**3 * start[1] + 3*(1-t)**2*t * cp1[1] + 3*(1-t)*t**2 * cp2[1] + t**3 * end[1]
-
-            # Add small random jitter
-            x += random.uniform(-2, 2)
-            y += random.uniform(-2, 2)
+            u = 1 - t
+            # Cubic bezier (Bernstein) weights, shared by x and y
+            b0 = u * u * u
+            b1 = 3 * u * u * t
+            b2 = 3 * u * t * t
+            b3 = t * t * t
 
-            path.append((int(x), int(y)))
+            # Curve point plus small random jitter, uniform in [-2, 2)
+            xs[i] = int(b0 * sx + b1 * c1x + b2 * c2x + b3 * ex + 4 * rand() - 2)
+            ys[i] = int(b0 * sy + b1 * c1y + b2 * c2y + b3 * ey + 4 * rand() - 2)
 
-        return path
+        return xs, ys
 
     def scroll_pattern(self, total_distance: int) -> list:
         """Generate human-like scroll pattern (not smooth/linear)."""
@@ -165,17 +199,28 @@ class HumanBehavior:
         Get a random click position within an element.
         Humans don't click exactly in the center.
         """
-        max_offset_x = min(element_size[0] // 3, 20)
-        max_offset_y = min(element_size[1] // 3, 10)
+        # Sizes may be floats (Playwright bounding boxes); randrange needs ints
+        max_offset_x = int(min(element_size[0] // 3, 20))
+        max_offset_y = int(min(element_size[1] // 3, 10))
 
-        offset_x = random.randint(-max_offset_x, max_offset_x)
-        offset_y = random.randint(-max_offset_y, max_offset_y)
+        randrange = self._rng.randrange
+        offset_x = randrange(-max_offset_x, max_offset_x + 1)
+        offset_y = randrange(-max_offset_y, max_offset_y + 1)
 
         return (
             element_center[0] + offset_x,
             element_center[1] + offset_y
         )
 
+    def click_offsets_batch(
+        self,
+        centers: List[Tuple[int, int]],
+        sizes: List[Tuple[int, int]]
+    ) -> List[Tuple[int, int]]:
+        """Get click positions for several elements at once (e.g. a whole form)."""
+        click_offset = self.click_offset
+        return [click_offset(center, size) for center, size in zip(centers, sizes)]
+
     def reading_time(self, text_length: int) -> float:
         """Estimate human reading time for text."""
         # Average reading speed: 200-300 words per minute
@@ -186,7 +231,46 @@ class HumanBehavior:
 
     def form_fill_delay(self) -> float:
         """Delay between form fields (looking for next field)."""
-        return random.uniform(0.3, 1.0) * self.speed_multiplier
+        return (0.3 + 0.7 * self._rng.random()) * self.speed_multiplier
+
+
+def _batch_typing_sequence(sequence: list, speed_multiplier: float = 1.0) -> list:
+    """
+    Coalesce a get_typing_sequence() result into (kind, chars, delay) events.
+
+    Runs of characters with similar delays (within _RUN_DELAY_TOLERANCE of
+    the run mean) become one ('TYPE', run, mean_delay) event, so the cadence
+    still varies from run to run. 'PAUSE'/'BACKSPACE' keep their own timing,
+    and a character whose delay is above the normal per-key range (a thinking
+    pause) is typed on its own and followed by an explicit 'PAUSE'.
+    """
+    pause_threshold = _MAX_KEY_DELAY * speed_multiplier
+    events = []
+    run = []
+    run_total = 0.0
+
+    for item, delay in sequence:
+        is_special = item in ('PAUSE', 'BACKSPACE')
+        is_pause = not is_special and delay > pause_threshold
+        if run:
+            run_mean = run_total / len(run)
+            if is_special or is_pause or abs(delay - run_mean) > _RUN_DELAY_TOLERANCE * run_mean:
+                events.append(('TYPE', ''.join(run), run_mean))
+                run, run_total = [], 0.0
+
+        if is_special:
+            events.append((item, '', delay))
+        elif is_pause:
+            events.append(('TYPE', item, 0.0))
+            events.append(('PAUSE', '', delay))
+        else:
+            run.append(item)
+            run_total += delay
+
+    if run:
+        events.append(('TYPE', ''.join(run), run_total / len(run)))
+
+    return events
 
 
 # Playwright integration helpers
@@ -202,14 +286,14 @@ async def human_type(page, selector: str, text: str, behavior: HumanBehavior = N
     await behavior.async_sleep(0.2, 0.5)
 
     sequence = behavior.get_typing_sequence(text)
-    for item, delay in sequence:
-        if item == 'PAUSE':
-            await asyncio.sleep(delay)
-        elif item == 'BACKSPACE':
+    for kind, chars, delay in _batch_typing_sequence(sequence, behavior.speed_multiplier):
+        if kind == 'TYPE':
+            # Per-key delay runs browser-side, one CDP round-trip per run
+            await page.keyboard.type(chars, delay=int(delay * 1000))
+        elif kind == 'BACKSPACE':
             await page.keyboard.press('Backspace')
             await asyncio.sleep(delay)
         else:
-            await page.keyboard.type(item, delay=0)
             await asyncio.sleep(delay)
 
 
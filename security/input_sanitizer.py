@@ -5,55 +5,59 @@ Protects against prompt injection and malicious inputs
 
 import re
 import html
-from typing import Optional, List, Dict, Any
+import shlex
+import time
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Deque
+
+from . import patterns
+
+
+@lru_cache(maxsize=None)
+def _compile_scan(expressions: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, re.Pattern], ...], re.Pattern]:
+    """
+    Compile a pattern list once per distinct content.
+
+    Returns (source, compiled) pairs plus a single-scan union of them. Keyed
+    on the patterns themselves, so subclasses that override a list get their
+    own compiled set.
+    """
+    compiled = tuple((p, re.compile(p, re.IGNORECASE)) for p in expressions)
+    union = re.compile('|'.join(f'(?:{p})' for p in expressions), re.IGNORECASE)
+    return compiled, union
+
+
+# Sensitive-path and internal-address checks for sanitize_path/validate_url
+_SENSITIVE_PATH_RE = re.compile('|'.join(f'(?:{p})' for p in patterns.SENSITIVE_PATH_PATTERNS), re.IGNORECASE)
+_INTERNAL_URL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in patterns.INTERNAL_URL_PATTERNS)
+_INTERNAL_URL_RE = re.compile('|'.join(f'(?:{p})' for p in patterns.INTERNAL_URL_PATTERNS), re.IGNORECASE)
 
 
 class InputSanitizer:
     """Sanitizes user inputs to prevent prompt injection and other attacks."""
 
-    # Patterns that might indicate prompt injection attempts
-    INJECTION_PATTERNS = [
-        r'ignore\s+(previous|above|all)\s+instructions?',
-        r'disregard\s+(previous|above|all)',
-        r'forget\s+(everything|all|previous)',
-        r'you\s+are\s+now\s+',
-        r'act\s+as\s+(if|a|an)',
-        r'pretend\s+(you|to\s+be)',
-        r'new\s+instructions?:',
-        r'system\s*:\s*',
-        r'\[INST\]',
-        r'\[/INST\]',
-        r'<\|.*?\|>',
-        r'###\s*(instruction|system|user)',
-        r'ADMIN\s*MODE',
-        r'DEBUG\s*MODE',
-        r'sudo\s+',
-        r'rm\s+-rf',
-        r'eval\s*\(',
-        r'exec\s*\(',
-        r'__import__',
-        r'subprocess',
-        r'os\.system',
-    ]
-
-    # Dangerous shell patterns
-    SHELL_DANGEROUS_PATTERNS = [
-        r';\s*rm\s',
-        r'\|\s*rm\s',
-        r'`[^`]*rm[^`]*`',
-        r'\$\([^)]*rm[^)]*\)',
-        r'>\s*/dev/sd',
-        r'dd\s+if=',
-        r'mkfs\.',
-        r'format\s+[a-z]:',
-        r'del\s+/[fsq]',
-        r'rd\s+/s',
-    ]
+    # Class-level views of the shared registry (see patterns.py)
+    INJECTION_PATTERNS = list(patterns.INJECTION_PATTERNS)
+    SHELL_DANGEROUS_PATTERNS = list(patterns.SHELL_DANGEROUS_PATTERNS)
 
     def __init__(self, strict_mode: bool = True):
         self.strict_mode = strict_mode
-        self._compiled_injection = [re.compile(p, re.IGNORECASE) for p in self.INJECTION_PATTERNS]
-        self._compiled_shell = [re.compile(p, re.IGNORECASE) for p in self.SHELL_DANGEROUS_PATTERNS]
+
+    @staticmethod
+    def _find_matches(text: str, expressions: List[str], prefilter: bool) -> List[str]:
+        """
+        Return every entry of `expressions` that matches `text`, in list order.
+
+        With `prefilter`, one union search runs first and the per-pattern pass
+        only happens on a hit. That pays off for the shell list; the injection
+        list is faster scanned pattern by pattern, since the alternation loses
+        re's per-pattern literal-prefix search.
+        """
+        compiled, union = _compile_scan(tuple(expressions))
+        if prefilter and not union.search(text):
+            return []
+        return [source for source, pattern in compiled if pattern.search(text)]
 
     def check_prompt_injection(self, text: str) -> Dict[str, Any]:
         """
@@ -62,10 +66,7 @@ class InputSanitizer:
         Returns:
             Dict with 'safe' boolean and 'matches' list of detected patterns
         """
-        matches = []
-        for i, pattern in enumerate(self._compiled_injection):
-            if pattern.search(text):
-                matches.append(self.INJECTION_PATTERNS[i])
+        matches = self._find_matches(text, self.INJECTION_PATTERNS, prefilter=False)
 
         return {
             'safe': len(matches) == 0,
@@ -80,10 +81,7 @@ class InputSanitizer:
         Returns:
             Dict with 'safe' boolean and 'matches' list
         """
-        matches = []
-        for i, pattern in enumerate(self._compiled_shell):
-            if pattern.search(command):
-                matches.append(self.SHELL_DANGEROUS_PATTERNS[i])
+        matches = self._find_matches(command, self.SHELL_DANGEROUS_PATTERNS, prefilter=True)
 
         return {
             'safe': len(matches) == 0,
@@ -92,14 +90,9 @@ class InputSanitizer:
         }
 
     def sanitize_for_shell(self, text: str) -> str:
-        """Escape special characters for safe shell usage."""
-        # Remove null bytes
-        text = text.replace('\x00', '')
-        # Escape shell metacharacters
-        dangerous_chars = ['`', '$', '!', '&', '|', ';', '>', '<', '(', ')', '{', '}', '[', ']', '\\', '"', "'", '\n']
-        for char in dangerous_chars:
-            text = text.replace(char, '\\' + char)
-        return text
+        """Quote text as a single shell argument (POSIX single-quoting)."""
+        # Remove null bytes - they cannot appear in an argv entry
+        return shlex.quote(text.replace('\x00', ''))
 
     def sanitize_html(self, text: str) -> str:
         """Escape HTML entities to prevent XSS."""
@@ -119,20 +112,8 @@ class InputSanitizer:
             return None
 
         # Check for absolute paths to sensitive locations
-        sensitive_patterns = [
-            r'^/etc/',
-            r'^/root/',
-            r'^/var/log/',
-            r'^C:\\Windows\\',
-            r'^C:\\Program Files',
-            r'\.ssh/',
-            r'\.gnupg/',
-            r'\.aws/',
-        ]
-
-        for pattern in sensitive_patterns:
-            if re.match(pattern, path, re.IGNORECASE):
-                return None
+        if _SENSITIVE_PATH_RE.match(path):
+            return None
 
         return path
 
@@ -147,21 +128,12 @@ class InputSanitizer:
         }
 
         # Check for localhost/internal IPs (SSRF protection)
-        internal_patterns = [
-            r'localhost',
-            r'127\.0\.0\.',
-            r'192\.168\.',
-            r'10\.\d+\.',
-            r'172\.(1[6-9]|2\d|3[01])\.',
-            r'0\.0\.0\.0',
-            r'\[::1\]',
-        ]
-
-        for pattern in internal_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                result['safe'] = False
-                result['blocked'] = True
-                result['warnings'].append(f'Internal/localhost URL detected: {pattern}')
+        if _INTERNAL_URL_RE.search(url):
+            for pattern in _INTERNAL_URL_PATTERNS:
+                if pattern.search(url):
+                    result['safe'] = False
+                    result['blocked'] = True
+                    result['warnings'].append(f'Internal/localhost URL detected: {pattern.pattern}')
 
         # Check for suspicious protocols
         if not url.startswith(('http://', 'https://')):
@@ -179,26 +151,23 @@ class RateLimiter:
     def __init__(self, max_requests: int = 100, window_seconds: int = 60):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: Dict[str, List[float]] = {}
+        # Timestamps per identifier, oldest first
+        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
 
     def is_allowed(self, identifier: str) -> bool:
         """Check if request is allowed under rate limit."""
-        import time
-        now = time.time()
-
-        if identifier not in self.requests:
-            self.requests[identifier] = []
+        now = time.monotonic()
+        timestamps = self.requests[identifier]
 
         # Clean old requests
-        self.requests[identifier] = [
-            t for t in self.requests[identifier]
-            if now - t < self.window_seconds
-        ]
+        cutoff = now - self.window_seconds
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
-        if len(self.requests[identifier]) >= self.max_requests:
+        if len(timestamps) >= self.max_requests:
             return False
 
-        self.requests[identifier].append(now)
+        timestamps.append(now)
         return True
 
 
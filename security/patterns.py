@@ -0,0 +1,152 @@
+"""
+Security Pattern Registry
+Single source for the scan patterns shared by the security modules.
+"""
+
+# Shared across the popup (JavaScript) and prompt-injection scans
+EVAL_CALL = r'eval\s*\('
+
+# Common ad/tracking domains to block. Entries ending in '.' are host labels
+# ('ads.' blocks ads.example.com); the rest are registrable domains that also
+# cover their subdomains.
+AD_DOMAINS = (
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'facebook.net',
+    'fbcdn.net',
+    'analytics.',
+    'tracker.',
+    'tracking.',
+    'ad.',
+    'ads.',
+    'adserver.',
+    'advertising.',
+    'banner.',
+    'pixel.',
+    'beacon.',
+    'telemetry.',
+    'metrics.',
+    'taboola.com',
+    'outbrain.com',
+    'criteo.com',
+    'adnxs.com',
+    'pubmatic.com',
+    'rubiconproject.com',
+    'openx.net',
+    'bidswitch.net',
+    'casalemedia.com',
+    'quantserve.com',
+    'scorecardresearch.com',
+    'amazon-adsystem.com',
+)
+
+# Malicious popup patterns
+POPUP_PATTERNS = (
+    r'window\.open\s*\(',
+    r'window\.alert\s*\(',
+    r'window\.confirm\s*\(',
+    r'window\.prompt\s*\(',
+    r'document\.write\s*\(',
+    EVAL_CALL,
+    r'setTimeout\s*\(\s*["\']',
+    r'setInterval\s*\(\s*["\']',
+)
+
+# Suspicious URL patterns
+SUSPICIOUS_URLS = (
+    r'\.exe$',
+    r'\.scr$',
+    r'\.bat$',
+    r'\.cmd$',
+    r'\.msi$',
+    r'download.*\?.*redirect',
+    r'click.*track',
+    r'redirect\.',
+    r'bit\.ly',
+    r'tinyurl\.com',
+    r'goo\.gl',
+)
+
+# Elements that are often malicious/annoying
+BLOCK_SELECTORS = (
+    '[class*="popup"]',
+    '[class*="modal"]',
+    '[class*="overlay"]',
+    '[id*="popup"]',
+    '[id*="modal"]',
+    '[id*="overlay"]',
+    '[class*="newsletter"]',
+    '[class*="subscribe"]',
+    '[class*="cookie-banner"]',
+    '[class*="gdpr"]',
+    '[class*="consent"]',
+    'iframe[src*="ad"]',
+    'iframe[src*="banner"]',
+    'div[class*="ad-"]',
+    'div[id*="ad-"]',
+)
+
+# Patterns that might indicate prompt injection attempts
+INJECTION_PATTERNS = (
+    r'ignore\s+(previous|above|all)\s+instructions?',
+    r'disregard\s+(previous|above|all)',
+    r'forget\s+(everything|all|previous)',
+    r'you\s+are\s+now\s+',
+    r'act\s+as\s+(if|a|an)',
+    r'pretend\s+(you|to\s+be)',
+    r'new\s+instructions?:',
+    r'system\s*:\s*',
+    r'\[INST\]',
+    r'\[/INST\]',
+    r'<\|.*?\|>',
+    r'###\s*(instruction|system|user)',
+    r'ADMIN\s*MODE',
+    r'DEBUG\s*MODE',
+    r'sudo\s+',
+    r'rm\s+-rf',
+    EVAL_CALL,
+    r'exec\s*\(',
+    r'__import__',
+    r'subprocess',
+    r'os\.system',
+)
+
+# Dangerous shell patterns
+SHELL_DANGEROUS_PATTERNS = (
+    r';\s*rm\s',
+    r'\|\s*rm\s',
+    r'`[^`]*rm[^`]*`',
+    r'\$\([^)]*rm[^)]*\)',
+    r'>\s*/dev/sd',
+    r'dd\s+if=',
+    r'mkfs\.',
+    r'format\s+[a-z]:',
+    r'del\s+/[fsq]',
+    r'rd\s+/s',
+)
+
+# Absolute paths to sensitive locations
+SENSITIVE_PATH_PATTERNS = (
+    r'^/etc/',
+    r'^/root/',
+    r'^/var/log/',
+    r'^C:\\Windows\\',
+    r'^C:\\Program Files',
+    r'\.ssh/',
+    r'\.gnupg/',
+    r'\.aws/',
+)
+
+# Localhost/internal addresses (SSRF protection)
+INTERNAL_URL_PATTERNS = (
+    r'localhost',
+    r'127\.0\.0\.',
+    r'192\.168\.',
+    r'10\.\d+\.',
+    r'172\.(1[6-9]|2\d|3[01])\.',
+    r'0\.0\.0\.0',
+    r'\[::1\]',
+)
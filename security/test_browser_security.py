@@ -0,0 +1,71 @@
+"""Tests for security.browser_security."""
+
+import unittest
+
+from security.browser_security import BrowserSecurity, _hostname
+
+
+class HostnameTest(unittest.TestCase):
+
+    def test_hostname(self):
+        cases = {
+            'https://www.Doubleclick.net/x?a=1': 'www.doubleclick.net',
+            'https://user:pw@ads.example.com:8080/p': 'ads.example.com',
+            'http://[::1]:80/x': '[::1]',
+            'https://example.com?q=ads.other.com': 'example.com',
+            'https://doubleclick.net./x': 'doubleclick.net',
+            'https://a@b@doubleclick.net/': 'doubleclick.net',
+            'https://user@ads.example.com/a@b': 'ads.example.com',
+            '  https://doubleclick.net/': 'doubleclick.net',
+            '//ads.example.com/x': 'ads.example.com',
+            'data:text/html;base64,AAAA': '',
+            'blob:https://ads.example.com/uuid': '',
+        }
+        for url, host in cases.items():
+            self.assertEqual(_hostname(url), host, url)
+
+    def test_is_ad_host(self):
+        security = BrowserSecurity()
+        self.assertTrue(security._is_ad_host('doubleclick.net'))
+        self.assertTrue(security._is_ad_host('stats.g.doubleclick.net'))
+        self.assertTrue(security._is_ad_host('ads.example.com'))
+        self.assertFalse(security._is_ad_host('notdoubleclick.net'))
+        self.assertFalse(security._is_ad_host('road.com'))
+        self.assertFalse(security._is_ad_host('[::1]'))
+
+    def test_should_block_url(self):
+        security = BrowserSecurity()
+        self.assertTrue(security.should_block_url('https://doubleclick.net./x'))
+        self.assertTrue(security.should_block_url('https://a@b@doubleclick.net/'))
+        self.assertTrue(security.should_block_url('  https://doubleclick.net/'))
+        self.assertTrue(security.should_block_url('//ads.example.com/x'))
+        self.assertTrue(security.should_block_url('https://user:pw@ads.example.com:8080/p'))
+        self.assertFalse(security.should_block_url('https://road.com/'))
+        self.assertFalse(security.should_block_url('https://example.com/analytics.js'))
+        self.assertFalse(security.should_block_url('data:text/html,ads.example.com'))
+
+
+class PatternListTest(unittest.TestCase):
+
+    def test_ad_domains_edits_take_effect(self):
+        BrowserSecurity.AD_DOMAINS.append('evil.com')
+        try:
+            self.assertTrue(BrowserSecurity().should_block_url('https://evil.com/'))
+        finally:
+            BrowserSecurity.AD_DOMAINS.remove('evil.com')
+        self.assertFalse(BrowserSecurity().should_block_url('https://evil.com/'))
+
+    def test_subclass_lists(self):
+        class Custom(BrowserSecurity):
+            AD_DOMAINS = ['foo.com']
+            SUSPICIOUS_URLS = [r'\.zip$']
+
+        custom = Custom()
+        self.assertTrue(custom.should_block_url('https://cdn.foo.com/x.js'))
+        self.assertFalse(custom.should_block_url('https://ads.example.com/'))
+        self.assertTrue(custom.should_block_url('https://example.com/a.zip'))
+        self.assertFalse(BrowserSecurity().should_block_url('https://example.com/a.zip'))
+
+
+if __name__ == '__main__':
+    unittest.main()
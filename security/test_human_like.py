@@ -0,0 +1,69 @@
+"""Tests for security.human_like."""
+
+import unittest
+
+from security.human_like import HumanBehavior, _batch_typing_sequence
+
+
+class BatchTypingSequenceTest(unittest.TestCase):
+
+    def test_plain_run_is_one_event(self):
+        events = _batch_typing_sequence([('a', 0.1), ('b', 0.11), ('c', 0.09)])
+        self.assertEqual(len(events), 1)
+        kind, chars, delay = events[0]
+        self.assertEqual((kind, chars), ('TYPE', 'abc'))
+        self.assertAlmostEqual(delay, 0.1)
+
+    def test_different_cadence_starts_new_run(self):
+        events = _batch_typing_sequence([('a', 0.06), ('b', 0.06), ('c', 0.14), ('d', 0.14)])
+        self.assertEqual([(k, c) for k, c, _ in events], [('TYPE', 'ab'), ('TYPE', 'cd')])
+        self.assertAlmostEqual(events[0][2], 0.06)
+        self.assertAlmostEqual(events[1][2], 0.14)
+
+    def test_consecutive_pauses_are_not_averaged(self):
+        events = _batch_typing_sequence([('a', 0.5), ('b', 0.5), ('c', 0.1)])
+        self.assertEqual(events, [
+            ('TYPE', 'a', 0.0), ('PAUSE', '', 0.5),
+            ('TYPE', 'b', 0.0), ('PAUSE', '', 0.5),
+            ('TYPE', 'c', 0.1),
+        ])
+
+    def test_pause_mid_run_splits_it(self):
+        events = _batch_typing_sequence([('a', 0.1), ('b', 0.4), ('c', 0.1)])
+        self.assertEqual(events, [
+            ('TYPE', 'a', 0.1), ('TYPE', 'b', 0.0), ('PAUSE', '', 0.4), ('TYPE', 'c', 0.1),
+        ])
+
+    def test_typo_markers_keep_timing(self):
+        sequence = [('x', 0.1), ('PAUSE', 0.3), ('BACKSPACE', 0.1), ('P', 0.1)]
+        self.assertEqual(_batch_typing_sequence(sequence), [
+            ('TYPE', 'x', 0.1), ('PAUSE', '', 0.3), ('BACKSPACE', '', 0.1), ('TYPE', 'P', 0.1),
+        ])
+
+    def test_threshold_scales_with_speed(self):
+        # 0.3s is a pause at normal speed but an ordinary key when slow
+        self.assertEqual(len(_batch_typing_sequence([('a', 0.3)])), 2)
+        self.assertEqual(_batch_typing_sequence([('a', 0.3)], 1.5), [('TYPE', 'a', 0.3)])
+
+    def test_round_trips_generated_sequence(self):
+        behavior = HumanBehavior()
+        text = 'The quick brown fox jumps over the lazy dog.' * 3
+        sequence = behavior.get_typing_sequence(text)
+        events = _batch_typing_sequence(sequence, behavior.speed_multiplier)
+        typed = ''.join(chars for kind, chars, _ in events if kind == 'TYPE')
+        expected = ''.join(item for item, _ in sequence if item not in ('PAUSE', 'BACKSPACE'))
+        self.assertEqual(typed, expected)
+
+    def test_generated_sequence_keeps_varied_cadence(self):
+        behavior = HumanBehavior()
+        sequence = behavior.get_typing_sequence('The quick brown fox jumps over the lazy dog.' * 3)
+        events = _batch_typing_sequence(sequence, behavior.speed_multiplier)
+        run_delays = {delay for kind, chars, delay in events if kind == 'TYPE' and len(chars) > 1}
+        self.assertGreater(len(run_delays), 1)
+        for kind, chars, delay in events:
+            if kind == 'TYPE' and len(chars) > 1:
+                self.assertLessEqual(delay, 0.225)
+
+
+if __name__ == '__main__':
+    unittest.main()